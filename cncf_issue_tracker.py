@@ -6,14 +6,25 @@ Optimized for Railway/Render deployment.
 """
 
 import os
+import functools
 import asyncio
 import logging
+import signal
+from html import escape
 from datetime import datetime, timedelta
-from typing import List
+from collections import OrderedDict
+from typing import List, Set, Tuple
 import aiohttp
 import sqlite3
+import threading
 from dataclasses import dataclass, field
 
+# Prefer orjson's C parser for GitHub API payloads; fall back to the stdlib
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Configuration
 try:
     from config import (
@@ -53,6 +64,7 @@ except ImportError:
     CHECK_BUFFER_MINUTES = 2
 
 
+@functools.lru_cache(maxsize=1)
 def resolve_default_db_path(default_path: str) -> str:
     """Select a safe database path for Railway or local runs.
 
@@ -77,7 +89,8 @@ class Config:
     telegram_bot_token: str = os.getenv('TELEGRAM_BOT_TOKEN', '')
     telegram_chat_id: str = os.getenv('TELEGRAM_CHAT_ID', '')
     check_interval: int = int(os.getenv('CHECK_INTERVAL', str(DEFAULT_CHECK_INTERVAL)))
-    db_path: str = os.getenv('DB_PATH', resolve_default_db_path(DATABASE_PATH))
+    # Resolved in __post_init__ so importing the module does no filesystem probing
+    db_path: str = ''
     repositories: List[str] = field(default_factory=list)
     log_level: str = os.getenv('LOG_LEVEL', LOG_LEVEL)
     batch_size: int = int(os.getenv('BATCH_SIZE', str(BATCH_SIZE)))
@@ -90,8 +103,13 @@ class Config:
         # If repositories not provided, copy from module-level REPOSITORIES safely
         if not self.repositories:
             self.repositories = list(REPOSITORIES)
+        if not self.db_path:
+            self.db_path = os.getenv('DB_PATH') or resolve_default_db_path(DATABASE_PATH)
 
-@dataclass
+# Shared by every issue without labels
+_EMPTY_LABELS: Tuple[str, ...] = ()
+
+@dataclass(slots=True, frozen=True)
 class Issue:
     id: int
     number: int
@@ -100,62 +118,157 @@ class Issue:
     created_at: str
     repository: str
     author: str
-    labels: List[str]
+    labels: Tuple[str, ...]
 
 class Database:
+    # Kept as constants so sqlite3's statement cache reuses the prepared statements
+    _SQL_SELECT = 'SELECT 1 FROM tracked_issues WHERE issue_id = ? AND repository = ?'
+    _SQL_INSERT = (
+        'INSERT OR IGNORE INTO tracked_issues (issue_id, repository, created_at) '
+        'VALUES (?, ?, ?)'
+    )
+    # Upper bound on (issue_id, repository) keys remembered in memory
+    _SEEN_MAXSIZE = 50_000
+    # Coalesce inserts into one transaction of up to this many rows...
+    _WRITE_BATCH_SIZE = 100
+    # ...or whatever arrived within this many seconds of the first one
+    _WRITE_FLUSH_INTERVAL = 0.1
+    
     def __init__(self, db_path: str):
         self.db_path = db_path
+        # One connection for the life of the tracker (autocommit mode)
+        self.conn = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None, cached_statements=128
+        )
+        # Serialises connection use between the event loop and worker threads
+        self._lock = threading.Lock()
+        # LRU of known-tracked issues; safe because tracked_issues is append-only.
+        # Only touched from the event loop thread, so it needs no lock.
+        self._seen: OrderedDict[Tuple[int, str], None] = OrderedDict()
+        # Pending inserts, drained by the writer task once started
+        self._write_q: asyncio.Queue[Issue] = asyncio.Queue()
+        self._writer_task: asyncio.Task | None = None
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
         self.init_db()
     
     def init_db(self):
         """Initialize the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS tracked_issues (
-                issue_id INTEGER,
-                repository TEXT,
-                created_at TEXT,
-                tracked_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                PRIMARY KEY (issue_id, repository)
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS tracked_issues (
+                    issue_id INTEGER,
+                    repository TEXT,
+                    created_at TEXT,
+                    tracked_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (issue_id, repository)
+                )
+            ''')
+            # Prepare both hot statements up front; the insert is rolled back
+            self.conn.execute(self._SQL_SELECT, (0, '')).fetchone()
+            self.conn.execute('BEGIN')
+            try:
+                self.conn.execute(self._SQL_INSERT, (0, '', ''))
+            finally:
+                self.conn.execute('ROLLBACK')
     
-    def is_issue_tracked(self, issue_id: int, repository: str) -> bool:
+    async def is_issue_tracked(self, issue_id: int, repository: str) -> bool:
         """Check if an issue is already tracked."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            'SELECT 1 FROM tracked_issues WHERE issue_id = ? AND repository = ?',
-            (issue_id, repository)
-        )
-        
-        result = cursor.fetchone()
-        conn.close()
-        return result is not None
+        key = (issue_id, repository)
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            return True
+        # Cache miss: query SQLite off the event loop
+        tracked = await asyncio.to_thread(self._select_tracked, key)
+        if tracked:
+            self._remember(key)
+        return tracked
+    
+    def _select_tracked(self, key: Tuple[int, str]) -> bool:
+        """Look up a tracked issue in SQLite (blocking)."""
+        with self._lock:
+            return self.conn.execute(self._SQL_SELECT, key).fetchone() is not None
+    
+    def _remember(self, key: Tuple[int, str]):
+        """Record a tracked issue in the LRU, evicting the oldest entries."""
+        self._seen[key] = None
+        self._seen.move_to_end(key)
+        while len(self._seen) > self._SEEN_MAXSIZE:
+            self._seen.popitem(last=False)
     
     def add_issue(self, issue: Issue):
         """Add a new issue to tracking."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        self._remember((issue.id, issue.repository))
+        if self._writer_task is None:
+            self._write_batch([issue])
+        else:
+            self._write_q.put_nowait(issue)
+    
+    def _write_batch(self, issues: List[Issue]):
+        """Insert a batch of issues in a single transaction."""
+        rows = [(issue.id, issue.repository, issue.created_at) for issue in issues]
         try:
-            cursor.execute('''
-                INSERT OR IGNORE INTO tracked_issues (issue_id, repository, created_at)
-                VALUES (?, ?, ?)
-            ''', (issue.id, issue.repository, issue.created_at))
-            conn.commit()
+            with self._lock:
+                self.conn.execute('BEGIN IMMEDIATE')
+                try:
+                    self.conn.executemany(self._SQL_INSERT, rows)
+                except Exception:
+                    self.conn.execute('ROLLBACK')
+                    raise
+                self.conn.execute('COMMIT')
         except Exception as e:
             logging.error(f"Database error: {e}")
-        finally:
-            conn.close()
+    
+    def start_writer(self):
+        """Start the background task that batches inserts."""
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(self._writer_loop())
+    
+    async def _writer_loop(self):
+        """Drain queued issues in batches of _WRITE_BATCH_SIZE or per flush interval."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._write_q.get()]
+            deadline = loop.time() + self._WRITE_FLUSH_INTERVAL
+            try:
+                while len(batch) < self._WRITE_BATCH_SIZE:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._write_q.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            finally:
+                # Also runs on cancellation so collected rows are not lost
+                await asyncio.to_thread(self._write_batch, batch)
+    
+    async def aclose(self):
+        """Flush pending inserts and close the database connection."""
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+        pending = []
+        while not self._write_q.empty():
+            pending.append(self._write_q.get_nowait())
+        if pending:
+            await asyncio.to_thread(self._write_batch, pending)
+        await asyncio.to_thread(self._close_conn)
+    
+    def _close_conn(self):
+        """Close the connection once no thread is using it (blocking)."""
+        with self._lock:
+            self.conn.close()
 
 class GitHubAPI:
+    # Largest issues listing we are willing to buffer (20 issues is far below this)
+    _MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+    
     def __init__(self, token: str = ""):
         self.token = token
         self.base_url = "https://api.github.com"
@@ -168,10 +281,36 @@ class GitHubAPI:
         # Add token if provided (recommended for higher rate limits)
         if self.token:
             self.headers['Authorization'] = f'token {self.token}'
+        self.timeout_seconds = API_TIMEOUT
+        # Long-lived session so polls reuse the keep-alive connection to api.github.com
+        self._session: aiohttp.ClientSession | None = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def get_recent_issues(self, repository: str, since_minutes: int = 10) -> List[Issue]:
         """Fetch recent issues from a public repository."""
-        since_time = (datetime.utcnow() - timedelta(minutes=since_minutes)).isoformat() + 'Z'
+        issues_data = await self.fetch_recent_issue_data(repository, since_minutes)
+        return [self.parse_issue(issue_data, repository) for issue_data in issues_data]
+    
+    async def fetch_recent_issue_data(self, repository: str, since_minutes: int = 10) -> List[dict]:
+        """Fetch raw API data for recent issues, without building Issue objects."""
+        since = datetime.utcnow() - timedelta(minutes=since_minutes)
+        since_time = since.isoformat() + 'Z'
+        # Same format as GitHub's created_at, so plain string comparison works
+        created_cutoff = since.strftime('%Y-%m-%dT%H:%M:%SZ')
         
         url = f"{self.base_url}/repos/{repository}/issues"
         params = {
@@ -183,26 +322,37 @@ class GitHubAPI:
         }
         
         try:
-            timeout = aiohttp.ClientTimeout(total=self.timeout_seconds)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url, headers=self.headers, params=params) as response:
-                    if response.status == 200:
-                        issues_data = await response.json()
-                        # Filter out pull requests and parse issues
-                        issues = []
-                        for issue_data in issues_data:
-                            if not issue_data.get('pull_request'):  # Exclude PRs
-                                issues.append(self._parse_issue(issue_data, repository))
-                        return issues
-                    elif response.status == 403:
-                        logging.warning(f"Rate limit hit for {repository}")
-                        return []
-                    elif response.status == 404:
-                        logging.error(f"Repository {repository} not found or private")
-                        return []
-                    else:
-                        logging.warning(f"HTTP {response.status} for {repository}")
-                        return []
+            session = await self._get_session()
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    # Stream the body with a size cap instead of buffering it blindly
+                    body = bytearray()
+                    async for chunk in response.content.iter_chunked(65536):
+                        body.extend(chunk)
+                        if len(body) > self._MAX_RESPONSE_BYTES:
+                            logging.warning(f"Response too large for {repository}, skipping")
+                            return []
+                    # Parse straight from bytes (orjson needs no decode step)
+                    issues_data = json_loads(body)
+                    # Filter out pull requests
+                    issues = []
+                    for issue_data in issues_data:
+                        # `since` matches on update time; results are newest-created
+                        # first, so stop at the first one created before the window
+                        if issue_data.get('created_at', '') < created_cutoff:
+                            break
+                        if not issue_data.get('pull_request'):  # Exclude PRs
+                            issues.append(issue_data)
+                    return issues
+                elif response.status == 403:
+                    logging.warning(f"Rate limit hit for {repository}")
+                    return []
+                elif response.status == 404:
+                    logging.error(f"Repository {repository} not found or private")
+                    return []
+                else:
+                    logging.warning(f"HTTP {response.status} for {repository}")
+                    return []
         except asyncio.TimeoutError:
             logging.warning(f"Timeout fetching issues for {repository}")
             return []
@@ -210,13 +360,15 @@ class GitHubAPI:
             logging.error(f"Error fetching issues for {repository}: {str(e)}")
             return []
     
-    def _parse_issue(self, issue_data: dict, repository: str) -> Issue:
+    def parse_issue(self, issue_data: dict, repository: str) -> Issue:
         """Parse GitHub API issue data."""
-        labels = []
+        labels = _EMPTY_LABELS
         try:
-            labels = [lbl.get('name', '') for lbl in issue_data.get('labels', []) if isinstance(lbl, dict)]
+            raw_labels = issue_data.get('labels')
+            if raw_labels:
+                labels = tuple(lbl.get('name', '') for lbl in raw_labels if isinstance(lbl, dict))
         except Exception:
-            labels = []
+            labels = _EMPTY_LABELS
         return Issue(
             id=issue_data['id'],
             number=issue_data['number'],
@@ -228,33 +380,71 @@ class GitHubAPI:
             labels=labels,
         )
 
+# Static notification layout; only the per-issue fields are filled in per call
+_ISSUE_MESSAGE_TEMPLATE = (
+    "🆕 <b>New Issue</b>\n"
+    "\n"
+    "📋 <b>Title:</b> {title}\n"
+    "👤 <b>Author:</b> @{author}\n"
+    "📦 <b>Repository:</b> <code>{repository}</code>\n"
+    "🔗 <b>Link:</b> <a href=\"{url}\">#{number}</a>{labels_line}"
+)
+
+@functools.lru_cache(maxsize=2048)
+def _safe_label(name: str) -> str:
+    """Render a label as escaped, truncated inline code (labels repeat a lot)."""
+    safe = escape(name, quote=False)
+    if len(safe) > 20:
+        safe = safe[:17] + "..."
+    return f"<code>{safe}</code>"
+
 class TelegramBot:
     def __init__(self, bot_token: str, chat_id: str):
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.base_url = f"https://api.telegram.org/bot{bot_token}"
-    
-    async def send_message(self, message: str):
-        """Send a message to Telegram chat."""
-        url = f"{self.base_url}/sendMessage"
-        
-        data = {
+        # Token and chat are fixed, so build the endpoint and static fields once
+        self._send_url = f"{self.base_url}/sendMessage"
+        self._message_defaults = {
             'chat_id': self.chat_id,
-            'text': message,
             'parse_mode': 'HTML',
             'disable_web_page_preview': False,
             'disable_notification': False
         }
+        # Long-lived session so notifications reuse the keep-alive connection
+        self._session: aiohttp.ClientSession | None = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75),
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def send_message(self, message: str, disable_notification: bool = False):
+        """Send a message to Telegram chat."""
+        data = dict(self._message_defaults, text=message)
+        if disable_notification:
+            data['disable_notification'] = True
         
         try:
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, json=data) as response:
-                    if response.status == 200:
-                        return True
-                    else:
-                        logging.error(f"Telegram API error: {response.status}")
-                        return False
+            session = await self._get_session()
+            async with session.post(self._send_url, json=data) as response:
+                # Drain the body so the connection goes back to the pool
+                await response.read()
+                if response.status == 200:
+                    return True
+                else:
+                    logging.error(f"Telegram API error: {response.status}")
+                    return False
         except Exception as e:
             logging.error(f"Error sending Telegram message: {str(e)}")
             return False
@@ -262,37 +452,48 @@ class TelegramBot:
     def format_issue_notification(self, issue: Issue) -> str:
         """Format issue into clean chat-style notification."""
         # Clean title for HTML
-        title = issue.title.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        title = escape(issue.title, quote=False)
         
         # Truncate very long titles
         if len(title) > 80:
             title = title[:77] + "..."
-        # Labels (escaped and truncated per label)
+        # Labels (escaped and truncated per label), show up to 6 labels
         labels_line = ""
         if issue.labels:
-            safe_labels = []
-            for name in issue.labels[:6]:  # show up to 6 labels
-                safe = name.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                if len(safe) > 20:
-                    safe = safe[:17] + "..."
-                safe_labels.append(f"<code>{safe}</code>")
-            labels_line = "\n🏷️ <b>Labels:</b> " + ", ".join(safe_labels)
-        
-        message = f"""🆕 <b>New Issue</b>
-
-📋 <b>Title:</b> {title}
-👤 <b>Author:</b> @{issue.author}
-📦 <b>Repository:</b> <code>{issue.repository}</code>
-🔗 <b>Link:</b> <a href="{issue.url}">#{issue.number}</a>{labels_line}"""
+            labels_line = "\n🏷️ <b>Labels:</b> " + ", ".join(map(_safe_label, issue.labels[:6]))
         
-        return message
+        return _ISSUE_MESSAGE_TEMPLATE.format_map({
+            'title': title,
+            'author': issue.author,
+            'repository': issue.repository,
+            'url': issue.url,
+            'number': issue.number,
+            'labels_line': labels_line,
+        })
 
 class CNCFIssueTracker:
+    # Workers delivering queued notifications. Every send goes to the same chat,
+    # which Telegram limits to about one message per second, so a single worker
+    # keeps notification_delay global and preserves delivery order.
+    _NOTIFY_WORKERS = 1
+    # Bound on queued notifications; the oldest is dropped when full
+    _NOTIFY_QUEUE_SIZE = 1024
+    # Send silently while more than this many notifications are waiting
+    _QUIET_BACKLOG = 20
+    
     def __init__(self, config: Config):
         self.config = config
         self.github = GitHubAPI(config.github_token)
         self.telegram = TelegramBot(config.telegram_bot_token, config.telegram_chat_id)
         self.db = Database(config.db_path)
+        # New issues waiting for delivery, drained by the notification workers
+        self._notify_q: asyncio.Queue[Issue] = asyncio.Queue(maxsize=self._NOTIFY_QUEUE_SIZE)
+        self._workers: List[asyncio.Task] = []
+        self._pending: Set[Tuple[int, str]] = set()
+        # Set by signal handlers to end the monitoring loop
+        self._stop = asyncio.Event()
+        # Static for the life of the tracker, so built once up front
+        self._startup_msg = self._format_startup_message()
         
         # Setup logging
         logging.basicConfig(
@@ -343,20 +544,17 @@ class CNCFIssueTracker:
     async def check_repository(self, repository: str, since_minutes: int) -> int:
         """Check a single repository for new issues."""
         try:
-            recent_issues = await self.github.get_recent_issues(repository, since_minutes)
+            recent_issues = await self.github.fetch_recent_issue_data(repository, since_minutes)
             new_count = 0
             
-            for issue in recent_issues:
-                if not self.db.is_issue_tracked(issue.id, issue.repository):
-                    # New issue found!
-                    success = await self.notify_new_issue(issue)
-                    if success:
-                        self.db.add_issue(issue)
-                        new_count += 1
-                        self.logger.info(f"📢 Notified: {repository}#{issue.number}")
-                    
-                    # Rate limiting delay
-                    await asyncio.sleep(max(0, self.config.notification_delay))
+            for issue_data in recent_issues:
+                # Dedupe on the raw id so known issues never get parsed
+                key = (issue_data['id'], repository)
+                if key in self._pending or await self.db.is_issue_tracked(*key):
+                    continue
+                # New issue found! Queue it so the poll isn't held up
+                self._enqueue_notification(self.github.parse_issue(issue_data, repository))
+                new_count += 1
             
             return new_count
             
@@ -364,18 +562,58 @@ class CNCFIssueTracker:
             self.logger.error(f"❌ Error checking {repository}: {str(e)}")
             return 0
     
-    async def notify_new_issue(self, issue: Issue) -> bool:
+    def _enqueue_notification(self, issue: Issue):
+        """Queue a new issue for delivery, dropping the oldest one if the queue is full."""
+        if self._notify_q.full():
+            dropped = self._notify_q.get_nowait()
+            self._notify_q.task_done()
+            # Left untracked, so a later poll can pick it up again
+            self._pending.discard((dropped.id, dropped.repository))
+            self.logger.warning(f"⚠️ Notification queue full, dropped {dropped.repository}#{dropped.number}")
+        self._pending.add((issue.id, issue.repository))
+        self._notify_q.put_nowait(issue)
+    
+    async def _notification_worker(self):
+        """Deliver queued new-issue notifications one at a time."""
+        while True:
+            issue = await self._notify_q.get()
+            try:
+                quiet = self._notify_q.qsize() > self._QUIET_BACKLOG
+                await self.handle_new_issue(issue, disable_notification=quiet)
+            finally:
+                self._notify_q.task_done()
+    
+    async def handle_new_issue(self, issue: Issue, disable_notification: bool = False):
+        """Notify about a new issue and record it once delivered."""
+        try:
+            success = await self.notify_new_issue(issue, disable_notification)
+            if success:
+                self.db.add_issue(issue)
+                self.logger.info(f"📢 Notified: {issue.repository}#{issue.number}")
+            
+            # Rate limiting delay
+            await asyncio.sleep(max(0, self.config.notification_delay))
+        except Exception as e:
+            self.logger.error(f"❌ Error handling {issue.repository}#{issue.number}: {str(e)}")
+        finally:
+            self._pending.discard((issue.id, issue.repository))
+    
+    async def notify_new_issue(self, issue: Issue, disable_notification: bool = False) -> bool:
         """Send notification for a new issue."""
         message = self.telegram.format_issue_notification(issue)
-        return await self.telegram.send_message(message)
+        return await self.telegram.send_message(message, disable_notification=disable_notification)
     
     async def send_startup_notification(self):
         """Send startup notification."""
+        return await self.telegram.send_message(self._startup_msg)
+    
+    def _format_startup_message(self) -> str:
+        """Build the startup notification text from the configuration."""
         repo_list = "\n".join([f"• <code>{repo}</code>" for repo in self.config.repositories[:5]])
         if len(self.config.repositories) > 5:
             repo_list += f"\n• ... and {len(self.config.repositories) - 5} more"
         
-        message = f"""🚀 <b>CNCF Issue Tracker Started!</b>
+        return f"""🚀 <b>CNCF Issue Tracker Started!</b>
 
 ⏰ <b>Check Interval:</b> {self.config.check_interval // 60} minutes
 📦 <b>Monitoring {len(self.config.repositories)} repositories:</b>
@@ -383,42 +621,102 @@ class CNCFIssueTracker:
 {repo_list}
 
 Bot is now monitoring for new issues! 🎯"""
-        
-        return await self.telegram.send_message(message)
     
     async def run(self):
         """Main monitoring loop."""
         self.logger.info("🤖 Starting CNCF Issue Tracker Bot...")
         
-        # Send startup notification
+        # Stop cleanly on SIGTERM (Railway/Render shutdown) and Ctrl+C
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, self._stop.set)
+            except (NotImplementedError, RuntimeError):
+                pass  # Not supported on Windows event loops
+        
+        try:
+            await self._run_loop()
+        finally:
+            await self.close()
+    
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """Sleep up to `timeout` seconds; return True if shutdown was requested."""
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+    
+    async def close(self):
+        """Release network resources held by the tracker."""
+        # Undelivered issues stay untracked and are picked up on the next run
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        await self.github.close()
+        await self.telegram.close()
+        await self.db.aclose()
+    
+    async def _run_loop(self):
+        """Send the startup notification, then poll until stopped."""
+        self.db.start_writer()
+        
+        # Send startup notification while the first poll is already under way.
+        # Issues it finds wait in the queue until the workers start below.
+        first_check = asyncio.create_task(self.check_all_repositories())
         startup_success = await self.send_startup_notification()
         if not startup_success:
+            first_check.cancel()
+            await asyncio.gather(first_check, return_exceptions=True)
             self.logger.error("❌ Failed to send startup notification. Check Telegram credentials.")
             return
         
+        # Only deliver issue notifications once the startup message is out
+        self._workers = [
+            asyncio.create_task(self._notification_worker())
+            for _ in range(self._NOTIFY_WORKERS)
+        ]
+        
         self.logger.info(f"✅ Bot started - checking every {self.config.check_interval} seconds")
         
         # Main monitoring loop
-        while True:
+        while not self._stop.is_set():
             try:
-                await self.check_all_repositories()
+                if first_check is not None:
+                    check, first_check = first_check, None
+                    await check
+                else:
+                    await self.check_all_repositories()
                 
                 # Wait for next check
                 self.logger.info(f"⏳ Next check in {self.config.check_interval // 60} minutes...")
-                await asyncio.sleep(self.config.check_interval)
+                if await self._wait_for_stop(self.config.check_interval):
+                    break
                 
-            except KeyboardInterrupt:
-                self.logger.info("🛑 Bot stopped by user")
-                break
             except Exception as e:
                 self.logger.error(f"❌ Unexpected error: {str(e)}")
                 # Send error notification
                 error_msg = f"⚠️ <b>Bot Error</b>\n\nError: <code>{str(e)}</code>\n\nRetrying in 2 minutes..."
                 await self.telegram.send_message(error_msg)
-                await asyncio.sleep(120)  # Wait 2 minutes before retrying
+                if await self._wait_for_stop(120):  # Wait 2 minutes before retrying
+                    break
+        
+        if first_check is not None:
+            # Stopped before the first poll was collected
+            first_check.cancel()
+            await asyncio.gather(first_check, return_exceptions=True)
+        self.logger.info("🛑 Bot stopped")
 
 def main():
     """Entry point."""
+    # libuv-based event loop when available (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     config = Config()
     
     # Validate configuration
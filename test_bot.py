@@ -7,7 +7,7 @@ Tests configuration and Telegram connection locally.
 import os
 import asyncio
 import sys
-from cncf_issue_tracker import Config, TelegramBot, CNCFIssueTracker
+from cncf_issue_tracker import Config, TelegramBot, CNCFIssueTracker, GitHubAPI
 
 async def test_telegram_connection():
     """Test Telegram bot connection."""
@@ -40,6 +40,8 @@ This is a test message from your CNCF Issue Tracker Bot.
     except Exception as e:
         print(f"❌ Error testing Telegram: {str(e)}")
         return False
+    finally:
+        await bot.close()
 
 async def test_configuration():
     """Test bot configuration."""
@@ -74,10 +76,9 @@ async def test_github_api():
     test_repo = config.repositories[0]
     print(f"   • Testing with: {test_repo}")
     
+    github = GitHubAPI(config.github_token)
+    
     try:
-        from cncf_issue_tracker import GitHubAPI
-        github = GitHubAPI(config.github_token)
-        
         # Test API call
         issues = await github.get_recent_issues(test_repo, since_minutes=60)
         print(f"   • API call successful: {len(issues)} recent issues found")
@@ -86,6 +87,8 @@ async def test_github_api():
     except Exception as e:
         print(f"   • API call failed: {str(e)}")
         return False
+    finally:
+        await github.close()
 
 async def main():
     """Main test function."""